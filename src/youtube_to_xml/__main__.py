@@ -0,0 +1,6 @@
+"""Allow running the CLI as ``python -m youtube_to_xml``."""
+
+from youtube_to_xml.cli import main
+
+if __name__ == "__main__":
+    main()
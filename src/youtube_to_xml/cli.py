@@ -22,8 +22,8 @@ ARGPARSE_ERROR_CODE = 2  # argparse uses exit code 2 for argument errors
 
 
 def _has_txt_extension(input_string: str) -> bool:
-    """Check if input has .txt extension."""
-    return Path(input_string).suffix.lower() == ".txt"
+    """Check if input has .txt extension (case-insensitive)."""
+    return input_string.lower().endswith(".txt")
 
 
 def _sanitise_video_title_for_filename(video_title: str) -> str:
@@ -116,8 +116,8 @@ def _save_xml_output(xml_content: str, output_filename: str, execution_id: str)
     logger.info("[%s] Successfully created: %s", execution_id, output_file_path)
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command-line arguments."""
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments (from sys.argv when argv is None)."""
     parser = argparse.ArgumentParser(
         prog="youtube-to-xml",
         description="Convert YouTube transcripts to XML format with chapter detection",
@@ -144,17 +144,21 @@ def parse_arguments() -> argparse.Namespace:
         metavar="YOUTUBE_URL or yt_transcript.txt",
         help="YouTube transcript text file OR YouTube URL to convert",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    """Main entry point for YouTube to XML converter."""
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point for YouTube to XML converter.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:] when None
+    """
     setup_logging()
     logger = get_logger(__name__)
     execution_id = str(uuid.uuid4())[:8]
 
     try:
-        args = parse_arguments()
+        args = parse_arguments(argv)
         user_input = args.transcript
     except SystemExit as e:
         if e.code == ARGPARSE_ERROR_CODE:
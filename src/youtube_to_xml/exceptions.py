@@ -1,7 +1,10 @@
 """Custom exceptions for YouTube transcript processing."""
 
+from types import MappingProxyType
+from typing import ClassVar
+
 # Centralised default exception messages
-EXCEPTION_MESSAGES = {
+_DEFAULT_MESSAGES = {
     # File-related errors
     "file_empty_error": "Your file is empty",
     "file_invalid_format_error": "Wrong format in transcript file",
@@ -23,6 +26,9 @@ EXCEPTION_MESSAGES = {
     "invalid_input_error": "Input must be a YouTube URL or .txt file",
 }
 
+# Read-only public view so callers can't mutate the defaults by accident
+EXCEPTION_MESSAGES = MappingProxyType(_DEFAULT_MESSAGES)
+
 
 class BaseTranscriptError(Exception):
     """Base exception for all transcript processing failures."""
@@ -32,180 +38,129 @@ class BaseTranscriptError(Exception):
         super().__init__(message)
 
 
-class FileEmptyError(BaseTranscriptError):
+class _DefaultMessageError(BaseTranscriptError):
+    """Base for concrete exceptions that fall back to a class default message.
+
+    Each subclass sets DEFAULT_MESSAGE once at class definition, so raising
+    without a message is a plain attribute load rather than a dict lookup.
+    """
+
+    DEFAULT_MESSAGE: ClassVar[str]
+
+    def __init__(self, message: str | None = None) -> None:
+        """Initialise with custom message, or the class default if omitted."""
+        super().__init__(self.DEFAULT_MESSAGE if message is None else message)
+
+
+class FileEmptyError(_DefaultMessageError):
     """Raised when attempting to parse an empty transcript file."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["file_empty_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["file_empty_error"]
 
 
-class FileInvalidFormatError(BaseTranscriptError):
+class FileInvalidFormatError(_DefaultMessageError):
     """Raised when transcript file doesn't follow expected manual format."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["file_invalid_format_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["file_invalid_format_error"]
 
 
-class URLIsInvalidError(BaseTranscriptError):
+class URLIsInvalidError(_DefaultMessageError):
     """Raised when URL format is invalid (empty or malformed text)."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_is_invalid_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_is_invalid_error"]
 
 
-class URLVideoUnavailableError(BaseTranscriptError):
+class URLVideoUnavailableError(_DefaultMessageError):
     """Raised when YouTube video exists but is unavailable."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_video_unavailable_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_video_unavailable_error"]
 
 
-class URLVideoIsPrivateError(BaseTranscriptError):
+class URLVideoIsPrivateError(_DefaultMessageError):
     """Raised when YouTube video is private."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_video_is_private_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_video_is_private_error"]
 
 
-class URLTranscriptNotFoundError(BaseTranscriptError):
+class URLTranscriptNotFoundError(_DefaultMessageError):
     """Raised when YouTube video has no available transcript."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_transcript_not_found_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_transcript_not_found_error"]
 
 
-class URLRateLimitError(BaseTranscriptError):
+class URLRateLimitError(_DefaultMessageError):
     """Raised when access is temporarily blocked due to rate limiting."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_rate_limit_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_rate_limit_error"]
 
 
-class URLNotYouTubeError(BaseTranscriptError):
+class URLNotYouTubeError(_DefaultMessageError):
     """Raised when URL is not a YouTube video URL."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_not_youtube_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_not_youtube_error"]
 
 
-class URLIncompleteError(BaseTranscriptError):
+class URLIncompleteError(_DefaultMessageError):
     """Raised when YouTube URL has incomplete video ID."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_incomplete_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_incomplete_error"]
 
 
-class URLBotProtectionError(BaseTranscriptError):
+class URLBotProtectionError(_DefaultMessageError):
     """Raised when YouTube requires verification to access video."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_bot_protection_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_bot_protection_error"]
 
 
-class URLPlaylistNotSupportedError(BaseTranscriptError):
+class URLPlaylistNotSupportedError(_DefaultMessageError):
     """Raised when URL is a playlist rather than a single video."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_playlist_not_supported_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_playlist_not_supported_error"]
 
 
-class URLUnmappedError(BaseTranscriptError):
+class URLUnmappedError(_DefaultMessageError):
     """Raised when YouTube processing fails for unknown/unmapped yt-dlp errors."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["url_unmapped_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["url_unmapped_error"]
 
 
-class FileNotExistsError(BaseTranscriptError):
+class FileNotExistsError(_DefaultMessageError):
     """Raised when transcript file doesn't exist."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["file_not_exists_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["file_not_exists_error"]
 
 
-class FilePermissionError(BaseTranscriptError):
+class FilePermissionError(_DefaultMessageError):
     """Raised when file cannot be read due to permission issues."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["file_permission_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["file_permission_error"]
 
 
-class FileEncodingError(BaseTranscriptError):
+class FileEncodingError(_DefaultMessageError):
     """Raised when file is not UTF-8 encoded."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["file_encoding_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["file_encoding_error"]
 
 
-class InvalidInputError(BaseTranscriptError):
+class InvalidInputError(_DefaultMessageError):
     """Raised when input is neither a valid URL nor .txt file."""
 
-    def __init__(
-        self,
-        message: str = EXCEPTION_MESSAGES["invalid_input_error"],
-    ) -> None:
-        """Initialise with custom message."""
-        super().__init__(message)
+    DEFAULT_MESSAGE = EXCEPTION_MESSAGES["invalid_input_error"]
+
+
+# yt-dlp error message patterns mapped to our exceptions (built once at import).
+# Order encodes precedence: first match wins, so more specific patterns come first
+# (e.g. "[youtube] invalid-url:" before the "video unavailable" it also contains).
+_YT_DLP_ERROR_PATTERNS: tuple[tuple[str, type[BaseTranscriptError]], ...] = (
+    ("429", URLRateLimitError),
+    ("sign in to confirm you're not a bot", URLBotProtectionError),
+    ("private video", URLVideoIsPrivateError),
+    ("unsupported url", URLNotYouTubeError),
+    ("incomplete youtube id", URLIncompleteError),
+    ("is not a valid url", URLIsInvalidError),
+    ("[youtube] invalid-url:", URLIsInvalidError),
+    ("video unavailable", URLVideoUnavailableError),
+)
 
 
 def map_yt_dlp_exception(error: Exception) -> BaseTranscriptError:
@@ -217,25 +172,13 @@ def map_yt_dlp_exception(error: Exception) -> BaseTranscriptError:
     Returns:
         Appropriate custom exception for the error pattern
     """
-    error_msg = str(error).lower()
-
-    # Map specific error patterns to appropriate exceptions
-    error_patterns = [
-        ("429", URLRateLimitError),
-        ("sign in to confirm you're not a bot", URLBotProtectionError),
-        ("private video", URLVideoIsPrivateError),
-        ("unsupported url", URLNotYouTubeError),
-        ("incomplete youtube id", URLIncompleteError),
-        ("is not a valid url", URLIsInvalidError),
-        ("[youtube] invalid-url:", URLIsInvalidError),
-        ("video unavailable", URLVideoUnavailableError),
-    ]
-
-    for pattern, exception_class in error_patterns:
+    original_msg = str(error)
+    error_msg = original_msg.lower()
+
+    for pattern, exception_class in _YT_DLP_ERROR_PATTERNS:
         if pattern in error_msg:
             return exception_class()
 
     # Default for unknown yt-dlp errors - preserve original yt-dlp message
-    original_msg = str(error)
     clean_msg = original_msg.removeprefix("ERROR: ")
     return URLUnmappedError(clean_msg)
@@ -13,34 +13,45 @@ converted back to "M:SS" or "H:MM:SS" format for XML output.
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, TypedDict
+import multiprocessing
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
 
 from youtube_to_xml.exceptions import (
     FileEmptyError,
     FileInvalidFormatError,
 )
 from youtube_to_xml.models import (
-    Chapter as ModelsChapter,
-)
-from youtube_to_xml.models import (
+    Chapter,
     TranscriptDocument,
     TranscriptLine,
     VideoMetadata,
 )
-from youtube_to_xml.time_utils import TIMESTAMP_PATTERN, timestamp_to_seconds
+from youtube_to_xml.time_utils import (
+    TIMESTAMP_MAX_LENGTH,
+    TIMESTAMP_MIN_LENGTH,
+    is_timestamp,
+    timestamp_to_seconds,
+)
 
 
-# Private TypedDict definition for internal chapter metadata
-class _InternalChapterDict(TypedDict):
+# Private slotted dataclass for internal chapter metadata
+@dataclass(frozen=True, slots=True)
+class _InternalChapter:
     """Internal type for file-based chapter data during parsing."""
 
     title_index: int
     title: str
     start_time: float
-    transcript_start: int
+    first_timestamp_position: int  # Position of its first timestamp in the index list
 
 
 # Chapter detection rule: exactly 2 lines between timestamps indicates new chapter
@@ -49,81 +60,138 @@ LINES_FOR_CHAPTER_BOUNDARY = 2
 # Format validation constants
 MINIMUM_LINES_REQUIRED = 3
 
+# Transcripts handed to each worker process at a time when parsing in batches
+BATCH_CHUNK_SIZE = 4
 
-def _find_timestamps(transcript_lines: Sequence[str]) -> list[int]:
-    """Find all timestamp line indices in the transcript."""
-    return [
-        i
-        for i, line in enumerate(transcript_lines)
-        if TIMESTAMP_PATTERN.match(line.strip())
-    ]
+# Whitespace str.split() collapses that is neither a space nor a line boundary
+_OTHER_WHITESPACE = re.compile(r"[\t\x1f\xa0\u1680\u2000-\u200a\u202f\u205f\u3000]")
 
 
-def _validate_transcript_format(raw_transcript: str) -> None:
-    """Validate that the transcript is in YouTube format.
+def _validate_transcript_format(transcript_lines: Sequence[str]) -> None:
+    """Validate that the sanitized transcript lines are in YouTube format.
 
     Requirements
     - 1st line: (non-timestamp) → becomes first chapter
     - 2nd line: (timestamp e.g. "0:03") → becomes start_time for first chapter
     - 3rd line: (non-timestamp) → first text of first transcript line
     """
-    if not raw_transcript.strip():
+    if not transcript_lines:
         raise FileEmptyError
 
-    transcript_lines = raw_transcript.splitlines()
-
-    # Remove blank lines for validation (consistent with processing)
-    non_empty_lines = [line for line in transcript_lines if line.strip()]
-
     # Must have at least 3 lines for minimum format
-    if len(non_empty_lines) < MINIMUM_LINES_REQUIRED:
+    if len(transcript_lines) < MINIMUM_LINES_REQUIRED:
         raise FileInvalidFormatError
 
     # Validate expected format: title, timestamp, text
-    first_line_is_timestamp = TIMESTAMP_PATTERN.match(non_empty_lines[0].strip())
-    second_line_is_timestamp = TIMESTAMP_PATTERN.match(non_empty_lines[1].strip())
-    third_line_is_timestamp = TIMESTAMP_PATTERN.match(non_empty_lines[2].strip())
+    first_line_is_timestamp = is_timestamp(transcript_lines[0])
+    second_line_is_timestamp = is_timestamp(transcript_lines[1])
+    third_line_is_timestamp = is_timestamp(transcript_lines[2])
 
     # Raise error if format is invalid
     if first_line_is_timestamp or not second_line_is_timestamp or third_line_is_timestamp:
         raise FileInvalidFormatError
 
 
-def _find_first_chapter(
-    transcript_lines: list[str], timestamp_indices: list[int]
-) -> _InternalChapterDict | None:
-    """Find first chapter metadata if transcript starts with a title."""
-    if TIMESTAMP_PATTERN.match(transcript_lines[0].strip()):
-        return None
-
-    return {
-        "title_index": 0,
-        "title": transcript_lines[0],
-        "start_time": timestamp_to_seconds(transcript_lines[timestamp_indices[0]]),
-        "transcript_start": timestamp_indices[0],
-    }
-
-
-def _find_subsequent_chapters(
-    transcript_lines: list[str], timestamp_indices: list[int]
-) -> list[_InternalChapterDict]:
-    """Find subsequent chapters using the 2-line gap rule."""
-    chapters: list[_InternalChapterDict] = []
-    for i in range(len(timestamp_indices) - 1):
-        current_idx = timestamp_indices[i]
-        next_idx = timestamp_indices[i + 1]
-
-        if next_idx - current_idx - 1 == LINES_FOR_CHAPTER_BOUNDARY:
-            chapter_title_idx = next_idx - 1
-            chapters.append(
-                {
-                    "title_index": chapter_title_idx,
-                    "title": transcript_lines[chapter_title_idx],
-                    "start_time": timestamp_to_seconds(transcript_lines[next_idx]),
-                    "transcript_start": next_idx,
-                }
+def _iter_chapters(
+    transcript_lines: Sequence[str], timestamp_indices: array[int]
+) -> Iterator[_InternalChapter]:
+    """Validate and yield chapter metadata lazily in one pass over sanitized lines.
+
+    The format check on the first three lines doubles as the start of the scan:
+    the validated title and timestamp form the first chapter, and scanning
+    resumes after them. Each later chapter is yielded as soon as the 2-line gap
+    rule detects it. Every timestamp line index found along the way is appended
+    to timestamp_indices (before its chapter is yielded), so converting chapters
+    to TranscriptLine objects never has to re-check lines.
+
+    Raises:
+        FileEmptyError: If there are no lines
+        FileInvalidFormatError: If the first three lines are not title,
+            timestamp, text
+    """
+    _validate_transcript_format(transcript_lines)
+
+    # Bind hot lookups to locals once; this loop runs for every transcript line
+    record_timestamp = timestamp_indices.append
+    check_timestamp = is_timestamp
+    to_seconds = timestamp_to_seconds
+
+    # Validated head: line 0 is the first title and line 1 its start timestamp
+    first_timestamp_idx = 1
+    record_timestamp(first_timestamp_idx)
+    yield _InternalChapter(
+        title_index=0,
+        title=transcript_lines[0],
+        start_time=to_seconds(transcript_lines[first_timestamp_idx]),
+        first_timestamp_position=0,
+    )
+    previous_timestamp_idx = first_timestamp_idx
+
+    # Line 2 is validated text, so scanning resumes after the head
+    remaining_lines = islice(transcript_lines, MINIMUM_LINES_REQUIRED, None)
+    for i, line in enumerate(remaining_lines, start=MINIMUM_LINES_REQUIRED):
+        # Most lines are spoken text, far longer than any timestamp
+        if not (
+            TIMESTAMP_MIN_LENGTH <= len(line) <= TIMESTAMP_MAX_LENGTH
+            and check_timestamp(line)
+        ):
+            continue
+
+        record_timestamp(i)
+        if i - previous_timestamp_idx == LINES_FOR_CHAPTER_BOUNDARY + 1:
+            yield _InternalChapter(
+                title_index=i - 1,
+                title=transcript_lines[i - 1],
+                start_time=to_seconds(line),
+                first_timestamp_position=len(timestamp_indices) - 1,
             )
-    return chapters
+        previous_timestamp_idx = i
+
+
+def _validate_chapter_start_times(
+    file_chapters: Iterable[_InternalChapter],
+) -> Iterator[_InternalChapter]:
+    """Pass chapters through, enforcing strictly increasing start times."""
+    previous_start_time = -math.inf
+    for chapter in file_chapters:
+        if chapter.start_time <= previous_start_time:
+            msg = "Subsequent chapter timestamps must be strictly increasing"
+            raise FileInvalidFormatError(msg)
+        previous_start_time = chapter.start_time
+        yield chapter
+
+
+def _build_chapter(
+    transcript_lines: list[str],
+    timestamp_indices: array[int],
+    file_chapter: _InternalChapter,
+    next_file_chapter: _InternalChapter | None,
+) -> Chapter:
+    """Build a Chapter that runs until the next chapter or the end of transcript."""
+    if next_file_chapter is None:
+        stop_position = len(timestamp_indices)
+        transcript_end_idx = len(transcript_lines)
+        end_time = math.inf
+    else:
+        stop_position = next_file_chapter.first_timestamp_position
+        transcript_end_idx = next_file_chapter.title_index
+        end_time = next_file_chapter.start_time
+
+    # Build the tuple straight from the generator, with no intermediate list
+    chapter_transcript_lines = tuple(
+        _iter_transcript_lines(
+            transcript_lines,
+            timestamp_indices,
+            range(file_chapter.first_timestamp_position, stop_position),
+            transcript_end_idx,
+        )
+    )
+    return Chapter(
+        title=file_chapter.title,
+        start_time=file_chapter.start_time,
+        end_time=end_time,
+        transcript_lines=chapter_transcript_lines,
+    )
 
 
 def parse_transcript_file(raw_transcript: str) -> TranscriptDocument:
@@ -139,122 +207,148 @@ def parse_transcript_file(raw_transcript: str) -> TranscriptDocument:
         FileEmptyError: If transcript is empty
         FileInvalidFormatError: If format is invalid
     """
-    sanitized_transcript = _sanitize_transcript_spacing(raw_transcript)
+    # Sanitize once; every later step reuses the same list of lines
+    transcript_lines = _sanitize_transcript_spacing(raw_transcript)
+
+    # Validation and chapters stream out of a single pass over the lines; each
+    # chapter is built as soon as the next one (or end of transcript) fixes its range.
+    # Timestamp line indices are packed as C ints rather than boxed Python ints
+    timestamp_indices = array("i")
+    file_chapters = _validate_chapter_start_times(
+        _iter_chapters(transcript_lines, timestamp_indices)
+    )
 
-    _validate_transcript_format(sanitized_transcript)
+    chapters: list[Chapter] = []
+    pending: _InternalChapter | None = None
+    for file_chapter in file_chapters:
+        if pending is not None:
+            chapters.append(
+                _build_chapter(transcript_lines, timestamp_indices, pending, file_chapter)
+            )
+        pending = file_chapter
 
-    transcript_lines = sanitized_transcript.splitlines()
-    timestamp_indices = _find_timestamps(transcript_lines)
+    # Last chapter runs to the end of the transcript
+    if pending is not None:
+        chapters.append(
+            _build_chapter(transcript_lines, timestamp_indices, pending, None)
+        )
 
-    file_chapter_dicts: list[_InternalChapterDict] = []
+    return TranscriptDocument(
+        metadata=VideoMetadata(),  # Empty metadata for file method
+        chapters=chapters,
+    )
 
-    # Find first chapter
-    if first_chapter := _find_first_chapter(transcript_lines, timestamp_indices):
-        file_chapter_dicts.append(first_chapter)
 
-    # Find subsequent chapters
-    file_chapter_dicts.extend(
-        _find_subsequent_chapters(transcript_lines, timestamp_indices)
-    )
+def _parse_transcript_path(transcript_path: Path) -> TranscriptDocument:
+    """Read a UTF-8 transcript file and parse it (runs in a worker process)."""
+    return parse_transcript_file(transcript_path.read_text(encoding="utf-8"))
 
-    # Build chapters with TranscriptLine objects
-    chapters: list[ModelsChapter] = []
-    for i, file_chapter_dict in enumerate(file_chapter_dicts):
-        # Determine transcript range and end time for this chapter
-        if i < len(file_chapter_dicts) - 1:
-            transcript_end_idx = file_chapter_dicts[i + 1]["title_index"]
-            end_time = file_chapter_dicts[i + 1]["start_time"]
-            # Enforce monotonic chapter boundaries
-            if end_time <= file_chapter_dict["start_time"]:
-                msg = "Subsequent chapter timestamps must be strictly increasing"
-                raise FileInvalidFormatError(msg)
-        else:
-            transcript_end_idx = len(transcript_lines)
-            end_time = math.inf
 
-        # Extract transcript lines from start timestamp to range end
-        start_idx = file_chapter_dict["transcript_start"]
-        chapter_raw_lines = transcript_lines[start_idx:transcript_end_idx]
+def parse_transcript_files(
+    transcript_paths: Sequence[Path], max_workers: int | None = None
+) -> list[TranscriptDocument]:
+    """Read and parse many transcript files in parallel worker processes.
 
-        # Convert alternating timestamp/text strings to TranscriptLine objects
-        chapter_transcript_lines = _convert_strings_to_transcript_lines(chapter_raw_lines)
+    Parsing is CPU-bound and transcripts share no state, so each file is read and
+    parsed in a separate process to sidestep the GIL. Workers are spawned rather
+    than forked, since forking a multi-threaded process is unsafe.
 
-        chapters.append(
-            ModelsChapter(
-                title=file_chapter_dict["title"],
-                start_time=file_chapter_dict["start_time"],
-                end_time=end_time,
-                transcript_lines=chapter_transcript_lines,
+    Args:
+        transcript_paths: Paths to UTF-8 transcript text files
+        max_workers: Maximum worker processes (defaults to the CPU count)
+
+    Returns:
+        TranscriptDocuments in the same order as transcript_paths
+
+    Raises:
+        OSError: If any file can't be read
+        UnicodeDecodeError: If any file isn't UTF-8 encoded
+        FileEmptyError: If any transcript is empty
+        FileInvalidFormatError: If any transcript format is invalid
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(
+            executor.map(
+                _parse_transcript_path, transcript_paths, chunksize=BATCH_CHUNK_SIZE
             )
         )
 
-    return TranscriptDocument(
-        metadata=VideoMetadata(),  # Empty metadata for file method
-        chapters=chapters,
-    )
-
 
-def _sanitize_transcript_spacing(raw_transcript: str) -> str:
+def _sanitize_transcript_spacing(raw_transcript: str) -> list[str]:
     """Normalize whitespace and remove blank lines from transcript.
 
     Args:
         raw_transcript: Raw transcript text with potentially inconsistent spacing
 
     Returns:
-        Sanitized transcript string with normalized spacing (leading/trailing
+        Sanitized transcript lines with normalized spacing (leading/trailing
         whitespace trimmed, multiple spaces collapsed to single spaces,
         blank lines removed)
     """
-    sanitized_lines = [
-        " ".join(line.split()) for line in raw_transcript.splitlines() if line.strip()
-    ]
-    return "\n".join(sanitized_lines)
+    # Fast path: files that are already clean (the common case) need no rebuilding
+    lines = raw_transcript.splitlines()
+    if _lines_are_clean(lines):
+        return lines
+
+    # Otherwise collapse each line's whitespace runs and drop blank lines
+    return [" ".join(line.split()) for line in lines if line.strip()]
+
+
+def _lines_are_clean(lines: list[str]) -> bool:
+    """Check whether sanitizing would leave lines unchanged, using only C-level scans.
+
+    Clean lines are non-blank, with no leading, trailing or repeated spaces and no
+    whitespace other than plain spaces.
+    """
+    if "" in lines:
+        return False
+
+    # Lines never contain line boundaries, so "\n" here marks each line edge
+    text = "\n".join(lines)
+    return not (
+        text.startswith(" ")
+        or text.endswith(" ")
+        or "  " in text
+        or " \n" in text
+        or "\n " in text
+        or _OTHER_WHITESPACE.search(text)
+    )
 
 
-def _convert_strings_to_transcript_lines(
+def _iter_transcript_lines(
     raw_lines: list[str],
-) -> list[TranscriptLine]:
-    """Convert alternating timestamp/text strings to TranscriptLine objects.
+    timestamp_indices: array[int],
+    positions: range,
+    end: int,
+) -> Iterator[TranscriptLine]:
+    """Yield TranscriptLine objects for a chapter's already-located timestamps.
+
+    Each timestamp takes the line after it as its text, unless that line is
+    another timestamp or lies outside the chapter, in which case text is empty.
 
     Args:
         raw_lines: List of strings in alternating timestamp/text pattern
+        timestamp_indices: Indices of every timestamp line in raw_lines
+        positions: Positions in timestamp_indices of this chapter's timestamps
+        end: Index one past the chapter's last line
 
-    Returns:
-        List of TranscriptLine objects
+    Yields:
+        TranscriptLine objects in transcript order
     """
-    result: list[TranscriptLine] = []
-    i = 0
-
-    while i < len(raw_lines):
-        # Check if current line is a timestamp
-        if TIMESTAMP_PATTERN.match(raw_lines[i].strip()):
-            timestamp_str = raw_lines[i]
-
-            # Get the text that follows (or empty if at end)
-            if i + 1 < len(raw_lines):
-                # Check if next line is also a timestamp (shouldn't happen normally)
-                if TIMESTAMP_PATTERN.match(raw_lines[i + 1].strip()):
-                    # Two consecutive timestamps - add empty text for first
-                    text = ""
-                    i += 1  # Only advance by 1 to process next timestamp
-                else:
-                    # Normal case: timestamp followed by text
-                    text = raw_lines[i + 1]
-                    i += 2  # Advance past both timestamp and text
-            else:
-                # Timestamp at end of chapter with no following text
-                text = ""
-                i += 1
-
-            result.append(
-                TranscriptLine(
-                    timestamp=timestamp_to_seconds(timestamp_str),
-                    text=text,
-                )
-            )
+    # Bind hot lookups to locals once; this loop runs for every transcript line
+    to_seconds = timestamp_to_seconds
+    last_position = len(timestamp_indices) - 1
+
+    for position in positions:
+        timestamp_idx = timestamp_indices[position]
+        text_idx = timestamp_idx + 1
+        next_line_is_timestamp = (
+            position < last_position and timestamp_indices[position + 1] == text_idx
+        )
+        if text_idx < end and not next_line_is_timestamp:
+            text = raw_lines[text_idx]
         else:
-            # Non-timestamp line without preceding timestamp (shouldn't happen)
-            # Skip it
-            i += 1
-
-    return result
+            text = ""
+        yield TranscriptLine(timestamp=to_seconds(raw_lines[timestamp_idx]), text=text)
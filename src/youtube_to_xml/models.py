@@ -5,6 +5,7 @@ Models store raw data - formatting happens at presentation layer.
 """
 
 from dataclasses import dataclass
+from typing import NamedTuple
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,9 +22,12 @@ class VideoMetadata:
     video_url: str = ""
 
 
-@dataclass(frozen=True, slots=True)
-class TranscriptLine:
-    """A single timestamped transcript line."""
+class TranscriptLine(NamedTuple):
+    """A single timestamped transcript line.
+
+    A NamedTuple rather than a frozen dataclass: one is built per transcript line,
+    and tuple construction happens in C without per-field object.__setattr__.
+    """
 
     timestamp: float  # seconds
     text: str
@@ -36,7 +40,7 @@ class Chapter:
     title: str
     start_time: float
     end_time: float
-    transcript_lines: list[TranscriptLine]
+    transcript_lines: tuple[TranscriptLine, ...]
 
 
 @dataclass(frozen=True, slots=True)
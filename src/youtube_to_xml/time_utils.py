@@ -16,12 +16,21 @@ SECONDS_PER_MINUTE = 60
 MILLISECONDS_PER_SECOND = 1000.0
 
 # Timestamp format constants
-TIMESTAMP_PARTS_SHORT = 2  # M:SS format
-TIMESTAMP_PARTS_LONG = 3  # H:MM:SS format
+TIMESTAMP_SHORT_MAX_LENGTH = len("MM:SS")  # Longer timestamps are H:MM:SS format
 
 # Timestamp pattern matching M:SS, MM:SS, H:MM:SS, HH:MM:SS, or HHH:MM:SS
 # Minutes and seconds must be 00-59, hours can be up to 999
-TIMESTAMP_PATTERN = re.compile(r"^(\d{1,2}:[0-5]\d(:[0-5]\d)?|\d{3}:[0-5]\d:[0-5]\d)$")
+# Unanchored: use TIMESTAMP_PATTERN.fullmatch(), which anchors both ends
+TIMESTAMP_PATTERN = re.compile(r"\d{1,2}:[0-5]\d(?::[0-5]\d)?|\d{3}:[0-5]\d:[0-5]\d")
+
+# Shortest and longest possible timestamp lines, for cheap length pre-filtering
+TIMESTAMP_MIN_LENGTH = len("0:00")
+TIMESTAMP_MAX_LENGTH = len("999:59:59")
+
+
+def is_timestamp(line: str) -> bool:
+    """Return True if line is exactly a M:SS, MM:SS or H:MM:SS style timestamp."""
+    return TIMESTAMP_PATTERN.fullmatch(line) is not None
 
 
 def timestamp_to_seconds(timestamp_str: str) -> float:
@@ -40,29 +49,24 @@ def timestamp_to_seconds(timestamp_str: str) -> float:
     Raises:
         FileInvalidFormatError: If timestamp format is invalid
     """
-    # Validate format using regex pattern
+    # Validate format
     ts = timestamp_str.strip()
-    if not TIMESTAMP_PATTERN.match(ts):
+    if not is_timestamp(ts):
         msg = f"Invalid timestamp format: {timestamp_str}"
         raise FileInvalidFormatError(msg)
 
-    parts = ts.split(":")
+    # is_timestamp() guarantees the shape, so slice fields directly instead of
+    # splitting; every timestamp ends in ":SS"
+    seconds = int(ts[-2:])
 
-    if len(parts) == TIMESTAMP_PARTS_SHORT:  # M:SS or MM:SS format
-        minutes, seconds = parts
-        m = int(minutes)
-        s = int(seconds)
-        return float(m * SECONDS_PER_MINUTE + s)
+    if len(ts) <= TIMESTAMP_SHORT_MAX_LENGTH:  # M:SS or MM:SS format
+        minutes = int(ts[:-3])
+        return float(minutes * SECONDS_PER_MINUTE + seconds)
 
-    if len(parts) == TIMESTAMP_PARTS_LONG:  # H:MM:SS format
-        hours, minutes, seconds = parts
-        h = int(hours)
-        m = int(minutes)
-        s = int(seconds)
-        return float(h * SECONDS_PER_HOUR + m * SECONDS_PER_MINUTE + s)
-
-    msg = f"Invalid timestamp format: {timestamp_str}"
-    raise FileInvalidFormatError(msg)
+    # H:MM:SS format
+    hours = int(ts[:-6])
+    minutes = int(ts[-5:-3])
+    return float(hours * SECONDS_PER_HOUR + minutes * SECONDS_PER_MINUTE + seconds)
 
 
 def seconds_to_timestamp(seconds: float) -> str:
@@ -86,9 +90,8 @@ def seconds_to_timestamp(seconds: float) -> str:
         raise ValueError(msg)
 
     total_seconds = int(seconds)
-    hours = total_seconds // SECONDS_PER_HOUR
-    minutes = (total_seconds % SECONDS_PER_HOUR) // SECONDS_PER_MINUTE
-    secs = total_seconds % SECONDS_PER_MINUTE
+    hours, remainder = divmod(total_seconds, SECONDS_PER_HOUR)
+    minutes, secs = divmod(remainder, SECONDS_PER_MINUTE)
 
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
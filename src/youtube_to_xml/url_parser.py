@@ -8,13 +8,15 @@ Public API:
 """
 
 import json
+import logging
 import math
-import tempfile
-from pathlib import Path
-from typing import TypedDict, cast
+from bisect import bisect_right
+from typing import Required, TypedDict, cast
 from urllib.parse import urlparse
 
 import yt_dlp
+from yt_dlp.networking import Request
+from yt_dlp.networking.exceptions import RequestError
 from yt_dlp.utils import DownloadError, ExtractorError, UnsupportedError
 
 from youtube_to_xml.exceptions import (
@@ -25,7 +27,6 @@ from youtube_to_xml.exceptions import (
     URLUnmappedError,
     map_yt_dlp_exception,
 )
-from youtube_to_xml.logging_config import get_logger
 from youtube_to_xml.models import (
     Chapter,
     TranscriptDocument,
@@ -44,6 +45,15 @@ class _InternalChapterDict(TypedDict):
     end_time: float
 
 
+class _YtDlpSubtitle(TypedDict, total=False):
+    """Internal type for a yt-dlp requested subtitle entry."""
+
+    ext: str
+    url: Required[str]
+    data: str
+    http_headers: dict[str, str]
+
+
 class _YtDlpMetadata(TypedDict, total=False):
     """Internal type for the yt-dlp metadata fields we access."""
 
@@ -52,6 +62,8 @@ class _YtDlpMetadata(TypedDict, total=False):
     duration: int
     webpage_url: str
     chapters: list[_InternalChapterDict]
+    http_headers: dict[str, str]
+    requested_subtitles: dict[str, _YtDlpSubtitle] | None
 
 
 class _Json3Seg(TypedDict, total=False):
@@ -73,21 +85,18 @@ _TRANSCRIPT_LANGUAGE_PREFERENCES = (
     "en-orig",  # Auto-generated English (priority 1)
 )
 
-# Subtitle/transcript file extension for yt-dlp
+# Subtitle/transcript format requested from yt-dlp
 _TRANSCRIPT_FILE_EXT = "json3"
 
-# Module-level logger
-logger = get_logger(__name__)
+# Module-level logger (handlers are configured by the CLI via setup_logging)
+logger = logging.getLogger(__name__)
 
 
-def _get_youtube_transcript_file_priority(transcript_file_path: Path) -> int:
-    """Return priority for transcript file selection (0=highest)."""
-    name = transcript_file_path.name
-
-    # Check each language preference in order (index = priority)
-    for priority, lang in enumerate(_TRANSCRIPT_LANGUAGE_PREFERENCES):
-        if name.endswith(f".{lang}.{_TRANSCRIPT_FILE_EXT}"):
-            return priority
+def _get_youtube_transcript_language_priority(language: str) -> int:
+    """Return priority for transcript language selection (0=highest)."""
+    # Language preference index is its priority
+    if language in _TRANSCRIPT_LANGUAGE_PREFERENCES:
+        return _TRANSCRIPT_LANGUAGE_PREFERENCES.index(language)
 
     # Return lowest priority for unrecognized languages
     return len(_TRANSCRIPT_LANGUAGE_PREFERENCES)
@@ -192,21 +201,25 @@ def _validate_url_is_youtube_video(url: str) -> None:
             raise mapped_exception from e
 
 
-def _download_transcript_with_yt_dlp(url: str, temp_dir: Path) -> _YtDlpMetadata:
-    """Handle yt-dlp configuration and download of transcript.
+def _download_transcript_with_yt_dlp(
+    url: str,
+) -> tuple[_YtDlpMetadata, list[TranscriptLine]]:
+    """Handle yt-dlp configuration and in-memory download of transcript.
 
     Args:
         url: YouTube video URL
-        temp_dir: Temporary directory for downloaded files
 
     Returns:
-        Raw metadata dictionary from yt-dlp
+        Tuple of (raw metadata dictionary from yt-dlp, list of TranscriptLine objects)
+
+    Raises:
+        URLTranscriptNotFoundError: If no JSON3 transcript is available
     """
     # Validate URL is YouTube video before expensive operations
     _validate_url_is_youtube_video(url)
 
     yt_dlp_options = {
-        # Core purpose: Download transcripts
+        # Core purpose: Select transcripts (fetched in memory, never written)
         "writesubtitles": True,
         "writeautomaticsub": True,
         "subtitleslangs": _TRANSCRIPT_LANGUAGE_PREFERENCES,
@@ -214,8 +227,6 @@ def _download_transcript_with_yt_dlp(url: str, temp_dir: Path) -> _YtDlpMetadata
         # Download behavior: Skip video, only get transcripts
         "skip_download": True,
         "noplaylist": True,
-        # Output formatting: Where to save files
-        "outtmpl": str(Path(temp_dir) / "%(title)s [%(id)s].%(ext)s"),
         # UI/UX: Quiet operation for CLI user experience
         "quiet": True,
         "no_warnings": True,
@@ -224,53 +235,70 @@ def _download_transcript_with_yt_dlp(url: str, temp_dir: Path) -> _YtDlpMetadata
 
     with yt_dlp.YoutubeDL(yt_dlp_options) as ydl:  # type: ignore[reportArgumentType]
         try:
-            # a) YT-DLP: get complete video metadata from YouTube
+            # a) YT-DLP: get complete video metadata and requested subtitles
             raw_metadata = ydl.extract_info(url, download=False)
-            # b) YT-DLP: download subtitle files (.json3 format)
-            ydl.process_info(raw_metadata)
-        except (DownloadError, ExtractorError, UnsupportedError) as e:
+
+            # Stubs say non-None, but yt-dlp can return None at runtime
+            if raw_metadata is None:  # type: ignore[reportUnnecessaryComparison]
+                msg = (
+                    "Something weird happened, we couldn't get this video's information."
+                )
+                raise URLUnmappedError(msg)
+            metadata = cast("_YtDlpMetadata", raw_metadata)
+
+            # b) YT-DLP: fetch the JSON3 transcript straight into memory
+            subtitle = _select_transcript_subtitle(metadata)
+            transcript_json = subtitle.get("data") or _fetch_subtitle_bytes(
+                ydl, subtitle, metadata
+            )
+        except (DownloadError, ExtractorError, UnsupportedError, RequestError) as e:
             mapped_exception = map_yt_dlp_exception(e)
             raise mapped_exception from e
 
-    # Stubs say non-None, but yt-dlp can return None at runtime
-    if raw_metadata is None:  # type: ignore[reportUnnecessaryComparison]
-        msg = "Something weird happened, we couldn't get this video's information."
-        raise URLUnmappedError(msg)
-    return cast("_YtDlpMetadata", raw_metadata)
+    # Extract events → TranscriptLine objects (json.loads takes str or UTF-8 bytes)
+    events = json.loads(transcript_json).get("events", [])
+    return metadata, _extract_transcript_lines_from_json3(events)
 
 
-def _extract_transcript_lines_from_files(temp_dir: Path) -> list[TranscriptLine]:
-    """Process downloaded transcript files into TranscriptLine objects.
+def _select_transcript_subtitle(raw_metadata: _YtDlpMetadata) -> _YtDlpSubtitle:
+    """Select the best available JSON3 transcript by language priority.
 
-    Finds transcript files, selects the best one by language priority,
-    and extracts transcript lines from JSON3 format.
+    Uploaded English is preferred over auto-generated English.
 
     Args:
-        temp_dir: Directory containing downloaded transcript files
+        raw_metadata: Raw metadata dictionary from yt-dlp
 
     Returns:
-        List of TranscriptLine objects
+        The requested subtitle entry for the highest priority language
 
     Raises:
-        URLTranscriptNotFoundError: If no transcript files found
+        URLTranscriptNotFoundError: If no JSON3 transcript is available
     """
-    # Locate downloaded transcript files
-    transcript_files = list(temp_dir.glob(f"*.{_TRANSCRIPT_FILE_EXT}"))
+    requested_subtitles = raw_metadata.get("requested_subtitles") or {}
+    json3_subtitles = {
+        language: subtitle
+        for language, subtitle in requested_subtitles.items()
+        if subtitle.get("ext") == _TRANSCRIPT_FILE_EXT
+    }
+    if not json3_subtitles:
+        raise URLTranscriptNotFoundError
 
-    # Sort transcript files by priority: Uploaded English over auto-generated
-    transcript_files.sort(key=_get_youtube_transcript_file_priority)
+    language = min(json3_subtitles, key=_get_youtube_transcript_language_priority)
+    return json3_subtitles[language]
 
-    # Parse transcript files into structured objects
-    if not transcript_files:
-        raise URLTranscriptNotFoundError
 
-    # Use highest priority transcript file
-    transcript_file = transcript_files[0]
-    # Read JSON3 format from disk
-    transcript_data = json.loads(transcript_file.read_text(encoding="utf-8"))
-    # Extract events → TranscriptLine objects
-    events = transcript_data.get("events", [])
-    return _extract_transcript_lines_from_json3(events)
+def _fetch_subtitle_bytes(
+    ydl: yt_dlp.YoutubeDL, subtitle: _YtDlpSubtitle, raw_metadata: _YtDlpMetadata
+) -> bytes:
+    """Download a subtitle through yt-dlp's network stack without touching disk.
+
+    The raw bytes are returned undecoded; json.loads accepts them directly.
+    """
+    # Same headers yt-dlp would use when writing the subtitle file
+    headers = subtitle.get("http_headers") or raw_metadata.get("http_headers") or {}
+    request = Request(subtitle["url"], headers=headers)
+    with ydl.urlopen(request) as response:  # type: ignore[reportArgumentType]
+        return response.read()
 
 
 def _fetch_video_metadata_and_transcript(
@@ -288,20 +316,32 @@ def _fetch_video_metadata_and_transcript(
         Tuple of (VideoMetadata object, list of TranscriptLine objects,
                  list of _InternalChapterDict objects from YouTube API)
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Phase 1: Download transcript and metadata using yt-dlp
-        raw_metadata = _download_transcript_with_yt_dlp(url, Path(temp_dir))
+    # Phase 1: Download metadata and transcript in memory using yt-dlp
+    raw_metadata, transcript_lines = _download_transcript_with_yt_dlp(url)
 
-        # Phase 2: Process downloaded transcript files
-        transcript_lines = _extract_transcript_lines_from_files(Path(temp_dir))
+    # Phase 2: Create structured metadata object
+    metadata = _create_video_metadata(raw_metadata, url)
 
-        # Phase 3: Create structured metadata object
-        metadata = _create_video_metadata(raw_metadata, url)
+    # Phase 3: Extract raw YouTube chapter data (kept separate from VideoMetadata)
+    raw_youtube_chapters = raw_metadata.get("chapters", [])
 
-        # Phase 4: Extract raw YouTube chapter data (kept separate from VideoMetadata)
-        raw_youtube_chapters = raw_metadata.get("chapters", [])
+    return metadata, transcript_lines, raw_youtube_chapters
 
-        return metadata, transcript_lines, raw_youtube_chapters
+
+def _extract_json3_event_text(event: _Json3Event) -> str:
+    """Return the cleaned text of a JSON3 event, or "" if it carries none."""
+    # Events without segs carry no transcript data
+    segs = event.get("segs")
+    if not segs:
+        return ""
+
+    # Combine text from all parts (most events have exactly one)
+    if len(segs) == 1:
+        raw_text = segs[0].get("utf8", "")
+    else:
+        raw_text = "".join([seg["utf8"] for seg in segs if "utf8" in seg])
+    # Remove line breaks that YouTube adds for display formatting
+    return raw_text.strip().replace("\n", " ")
 
 
 def _extract_transcript_lines_from_json3(
@@ -315,27 +355,13 @@ def _extract_transcript_lines_from_json3(
     Returns:
         List of TranscriptLine objects with cleaned text and timestamps
     """
-    transcript_lines: list[TranscriptLine] = []
-
-    for event in events:
-        # Skip events without transcript data
-        if "segs" not in event:
-            continue
-
-        # Combine text from all parts
-        text_parts = [seg["utf8"] for seg in event["segs"] if "utf8" in seg]
-        # Remove line breaks that YouTube adds for display formatting
-        text = "".join(text_parts).strip().replace("\n", " ")
-        if not text:
-            continue
-
-        # Convert milliseconds to seconds
-        start_ms = event.get("tStartMs", 0)
-        start_seconds = start_ms / MILLISECONDS_PER_SECOND
-
-        transcript_lines.append(TranscriptLine(start_seconds, text))
-
-    return transcript_lines
+    # Built in one comprehension; events without text are skipped and
+    # milliseconds are converted to seconds
+    return [
+        TranscriptLine(event.get("tStartMs", 0) / MILLISECONDS_PER_SECOND, text)
+        for event in events
+        if (text := _extract_json3_event_text(event))
+    ]
 
 
 def _assign_transcript_lines_to_chapters(
@@ -345,6 +371,10 @@ def _assign_transcript_lines_to_chapters(
 ) -> list[Chapter]:
     """Assign transcript lines to chapters based on temporal boundaries.
 
+    Each line is placed with one binary search over the chapter start times
+    (YouTube returns chapters in start order), so assignment is O(N log C)
+    rather than filtering every line once per chapter.
+
     Args:
         metadata: Video metadata for title
         transcript_lines: List of all individual transcript lines
@@ -360,38 +390,45 @@ def _assign_transcript_lines_to_chapters(
                 title=metadata.video_title,
                 start_time=0,
                 end_time=math.inf,
-                transcript_lines=transcript_lines,
+                transcript_lines=tuple(transcript_lines),
             )
         ]
 
-    chapters: list[Chapter] = []
-
-    for i, youtube_chapter_dict in enumerate(chapter_dicts):
-        chapter_start_time = float(youtube_chapter_dict.get("start_time", 0))
-
-        # End time is start of next chapter, or infinity for last chapter
-        if i + 1 < len(chapter_dicts):
-            chapter_end_time = float(chapter_dicts[i + 1]["start_time"])
-        else:
-            chapter_end_time = math.inf
-
-        # Filter transcript lines within this chapter's time range
-        chapter_transcript_lines = [
-            line
-            for line in transcript_lines
-            if chapter_start_time <= line.timestamp < chapter_end_time
-        ]
-
-        chapters.append(
-            Chapter(
-                title=youtube_chapter_dict.get("title", f"Chapter {i + 1}"),
-                start_time=chapter_start_time,
-                end_time=chapter_end_time,
-                transcript_lines=chapter_transcript_lines,
-            )
+    # Unpack the chapter dicts once into parallel sequences
+    chapter_titles = [
+        youtube_chapter_dict.get("title", f"Chapter {i + 1}")
+        for i, youtube_chapter_dict in enumerate(chapter_dicts)
+    ]
+    chapter_start_times = [
+        float(youtube_chapter_dict.get("start_time", 0))
+        for youtube_chapter_dict in chapter_dicts
+    ]
+    # End time is start of next chapter, or infinity for last chapter
+    chapter_end_times = [*chapter_start_times[1:], math.inf]
+
+    # Bucket lines by the last chapter starting at or before each timestamp;
+    # lines before the first chapter belong to no chapter
+    chapter_buckets: list[list[TranscriptLine]] = [[] for _ in chapter_dicts]
+    for line in transcript_lines:
+        chapter_index = bisect_right(chapter_start_times, line.timestamp) - 1
+        if chapter_index >= 0:
+            chapter_buckets[chapter_index].append(line)
+
+    return [
+        Chapter(
+            title=title,
+            start_time=start_time,
+            end_time=end_time,
+            transcript_lines=tuple(bucket),
         )
-
-    return chapters
+        for title, start_time, end_time, bucket in zip(
+            chapter_titles,
+            chapter_start_times,
+            chapter_end_times,
+            chapter_buckets,
+            strict=True,
+        )
+    ]
 
 
 def parse_youtube_url(url: str) -> TranscriptDocument:
@@ -42,7 +42,9 @@ def _create_chapter_element(
     return chapter_elem
 
 
-def _format_transcript_lines(transcript_lines: list[TranscriptLine]) -> list[str]:
+def _format_transcript_lines(
+    transcript_lines: tuple[TranscriptLine, ...],
+) -> list[str]:
     """Format TranscriptLine objects as inline timestamp/text entries."""
     return [
         f"{seconds_to_timestamp(line.timestamp)} {line.text}" for line in transcript_lines
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import io
+import logging
 import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
 from typing import TYPE_CHECKING
 
+import pytest
+
 from youtube_to_xml.cli import (
+    _has_txt_extension,  # pyright: ignore[reportPrivateUsage]
     _sanitise_video_title_for_filename,  # pyright: ignore[reportPrivateUsage]
 )
+from youtube_to_xml.cli import main as cli_main
 from youtube_to_xml.exceptions import EXCEPTION_MESSAGES
 
 if TYPE_CHECKING:
@@ -15,22 +23,38 @@ if TYPE_CHECKING:
 
 
 def run_cli(args: str | list[str], tmp_path: Path) -> tuple[int, str]:
-    """Run youtube-to-xml CLI and return (exit_code, output)."""
-    if isinstance(args, str):
-        cmd_args = ["uv", "run", "youtube-to-xml", args]
-    else:
-        cmd_args = ["uv", "run", "youtube-to-xml"]
-        cmd_args.extend(args)
-
-    result = subprocess.run(  # noqa: S603
-        cmd_args,
-        capture_output=True,
-        text=True,
-        cwd=tmp_path,
-        check=False,
-    )
-
-    return result.returncode, result.stdout + result.stderr
+    """Run youtube-to-xml CLI in-process and return (exit_code, output).
+
+    Calls main() directly instead of spawning a process per test; output is
+    captured as stdout followed by stderr, matching a subprocess run. Root
+    logger handlers and level are restored afterwards so handlers installed by
+    setup_logging() do not leak into later tests.
+    """
+    argv = [args] if isinstance(args, str) else list(args)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+
+    with (
+        pytest.MonkeyPatch.context() as monkeypatch,
+        redirect_stdout(stdout),
+        redirect_stderr(stderr),
+    ):
+        monkeypatch.chdir(tmp_path)
+        try:
+            cli_main(argv)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        else:
+            exit_code = 0
+        finally:
+            for handler in root_logger.handlers:
+                if handler not in saved_handlers:
+                    handler.close()
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+
+    return exit_code, stdout.getvalue() + stderr.getvalue()
 
 
 def assert_error_has_prefix_and_suffix(output: str) -> None:
@@ -42,7 +66,6 @@ def assert_error_has_prefix_and_suffix(output: str) -> None:
 # =============================================================================
 # Unit Tests: Core Validation Functions
 # =============================================================================
-# NOTE: _has_txt_extension covered by CLI integration tests below
 # NOTE: URL validation logic tested in test_url_parser.py::TestValidateBasicUrlStructure
 
 
@@ -54,6 +77,23 @@ def test_sanitise_video_title_for_filename_comprehensive() -> None:
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    ("user_input", "expected"),
+    [
+        ("transcript.txt", True),
+        ("TRANSCRIPT.TXT", True),  # Case-insensitive
+        ("path/to/my.transcript.txt", True),
+        ("transcript.md", False),
+        ("transcript.txt.bak", False),
+        ("transcript", False),
+        ("https://youtu.be/xyz789", False),
+    ],
+)
+def test_has_txt_extension(user_input: str, *, expected: bool) -> None:
+    """Test .txt detection by suffix, ignoring case."""
+    assert _has_txt_extension(user_input) is expected
+
+
 # =============================================================================
 # CLI Tests: Argument & Input Validation
 # =============================================================================
@@ -68,74 +108,60 @@ def test_cli_shows_argparse_error_for_no_arguments(tmp_path: Path) -> None:
     assert "Try: youtube-to-xml --help" in output
 
 
-def test_cli_shows_error_for_non_url_non_txt_input(tmp_path: Path) -> None:
-    """Test rejection of input that's neither valid URL nor .txt file."""
-    exit_code, output = run_cli("some_text", tmp_path)
-
-    assert exit_code == 1
-    assert_error_has_prefix_and_suffix(output)
-    assert EXCEPTION_MESSAGES["invalid_input_error"] in output
-
-
-# =============================================================================
-# CLI Tests: File Extension Validation
-# =============================================================================
-
-
-def test_cli_shows_error_for_nonexistent_non_txt_extension(tmp_path: Path) -> None:
-    """Test rejection of non-.txt file extensions."""
-    exit_code, output = run_cli("nonexistent.md", tmp_path)
-
-    assert exit_code == 1
-    assert_error_has_prefix_and_suffix(output)
-    assert EXCEPTION_MESSAGES["invalid_input_error"] in output
-
-
-def test_cli_shows_error_for_existing_non_txt_extension(tmp_path: Path) -> None:
-    """Test rejection of non-.txt extensions even when file exists."""
-    test_file = tmp_path / "existing.md"
-    test_file.write_text("content", encoding="utf-8")
+@pytest.mark.parametrize(
+    ("user_input", "file_content", "message_key"),
+    [
+        # Input validation: neither a URL nor a .txt file
+        pytest.param("some_text", None, "invalid_input_error", id="non-url-non-txt"),
+        pytest.param(
+            "nonexistent.md", None, "invalid_input_error", id="nonexistent-non-txt"
+        ),
+        pytest.param(
+            "existing.md", "content", "invalid_input_error", id="existing-non-txt"
+        ),
+        # File processing errors
+        pytest.param(
+            "nonexistent.txt", None, "file_not_exists_error", id="nonexistent-txt"
+        ),
+        pytest.param("empty.txt", "", "file_empty_error", id="empty-txt"),
+        pytest.param(
+            "invalid.txt",
+            "not youtube transcript",
+            "file_invalid_format_error",
+            id="invalid-txt-format",
+        ),
+    ],
+)
+def test_cli_shows_error_for_bad_input(
+    tmp_path: Path, user_input: str, file_content: str | None, message_key: str
+) -> None:
+    """Test each rejected input exits 1 with its user-facing error message."""
+    if file_content is not None:
+        (tmp_path / user_input).write_text(file_content, encoding="utf-8")
 
-    exit_code, output = run_cli("existing.md", tmp_path)
+    exit_code, output = run_cli(user_input, tmp_path)
 
     assert exit_code == 1
     assert_error_has_prefix_and_suffix(output)
-    assert EXCEPTION_MESSAGES["invalid_input_error"] in output
+    assert EXCEPTION_MESSAGES[message_key] in output
 
 
 # =============================================================================
-# CLI Tests: File Processing Errors
+# CLI Tests: Installed Entry Point
 # =============================================================================
 
 
-def test_cli_shows_error_for_nonexistent_txt_file(tmp_path: Path) -> None:
-    """Test error message when .txt file doesn't exist."""
-    exit_code, output = run_cli("nonexistent.txt", tmp_path)
-
-    assert exit_code == 1
-    assert_error_has_prefix_and_suffix(output)
-    assert EXCEPTION_MESSAGES["file_not_exists_error"] in output
-
-
-def test_cli_shows_error_for_empty_txt_file(tmp_path: Path) -> None:
-    """Test error message for empty .txt file."""
-    test_file = tmp_path / "empty.txt"
-    test_file.write_text("", encoding="utf-8")
-
-    exit_code, output = run_cli("empty.txt", tmp_path)
-
-    assert exit_code == 1
-    assert_error_has_prefix_and_suffix(output)
-    assert EXCEPTION_MESSAGES["file_empty_error"] in output
-
-
-def test_cli_shows_error_for_invalid_txt_format(tmp_path: Path) -> None:
-    """Test error message for .txt file with invalid transcript format."""
-    test_file = tmp_path / "invalid.txt"
-    test_file.write_text("not youtube transcript", encoding="utf-8")
-
-    exit_code, output = run_cli("invalid.txt", tmp_path)
+@pytest.mark.subprocess
+def test_cli_smoke_subprocess(tmp_path: Path) -> None:
+    """Test the CLI entry point end to end in a real subprocess."""
+    result = subprocess.run(
+        [sys.executable, "-m", "youtube_to_xml"],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        check=False,
+    )
 
-    assert exit_code == 1
-    assert_error_has_prefix_and_suffix(output)
-    assert EXCEPTION_MESSAGES["file_invalid_format_error"] in output
+    assert result.returncode == 1
+    assert "usage: youtube-to-xml" in result.stderr
+    assert "Try: youtube-to-xml --help" in result.stderr
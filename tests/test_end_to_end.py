@@ -6,12 +6,14 @@ Tests complete successful workflows from user input to final output:
 - File vs URL equivalence verification
 
 Uses unified run_cli() helper with automatic rate limiting protection.
-Tests that hit YouTube API are marked with @pytest.mark.slow.
+Every test runs the CLI in a subprocess (@pytest.mark.subprocess); tests that
+hit YouTube API are also marked with @pytest.mark.slow.
 For error scenarios, see tests/test_exceptions_url.py.
 """
 
 import difflib
 import subprocess
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -19,7 +21,10 @@ import pytest
 
 from youtube_to_xml.exceptions import EXCEPTION_MESSAGES
 
+pytestmark = pytest.mark.subprocess
+
 # Test constants
+CLI_COMMAND = (sys.executable, "-m", "youtube_to_xml")
 EXAMPLES_DIR = Path("example_transcripts")
 URL_CHAPTERS = "https://www.youtube.com/watch?v=Q4gsvJvRjCU"
 URL_CHAPTERS_SHARED = "https://youtu.be/Q4gsvJvRjCU?si=8cEkF7OrXrB1R4d7&t=27"
@@ -29,21 +34,14 @@ URL_PLAYLIST = (
 )
 
 
-def run_cli(command: str, args: list[str] | str, tmp_path: Path) -> tuple[int, str]:
-    """Run script and return (exit_code, output).
+def run_cli(args: list[str] | str, tmp_path: Path) -> tuple[int, str]:
+    """Run youtube-to-xml CLI and return (exit_code, output).
 
     Args:
-        command: 'youtube-to-xml' (unified CLI)
         args: List of arguments or single URL string
         tmp_path: Working directory for the command
     """
-    if isinstance(args, str):
-        # Single URL
-        cmd_args = ["uv", "run", command, args]
-    else:
-        # List of args
-        cmd_args = ["uv", "run", command]
-        cmd_args.extend(args)
+    cmd_args = [*CLI_COMMAND, args] if isinstance(args, str) else [*CLI_COMMAND, *args]
 
     result = subprocess.run(  # noqa: S603
         cmd_args,
@@ -96,7 +94,7 @@ def test_file_multi_chapters_success(tmp_path: Path) -> None:
     input_file = EXAMPLES_DIR / "x4-chapters.txt"
     (tmp_path / "input.txt").write_text(input_file.read_text(encoding="utf-8"))
 
-    exit_code, output = run_cli("youtube-to-xml", ["input.txt"], tmp_path)
+    exit_code, output = run_cli(["input.txt"], tmp_path)
 
     assert exit_code == 0
     assert "Created:" in output
@@ -105,7 +103,6 @@ def test_file_multi_chapters_success(tmp_path: Path) -> None:
     output_file = tmp_path / "input.xml"
     reference_file = setup_reference_file(tmp_path, "x4-chapters.xml")
 
-    assert output_file.exists()
     assert_files_identical(output_file, reference_file)
 
 
@@ -114,7 +111,7 @@ def test_file_chapters_with_blanks_success(tmp_path: Path) -> None:
     input_file = EXAMPLES_DIR / "x3-chapters-with-blanks.txt"
     (tmp_path / "input.txt").write_text(input_file.read_text(encoding="utf-8"))
 
-    exit_code, output = run_cli("youtube-to-xml", ["input.txt"], tmp_path)
+    exit_code, output = run_cli(["input.txt"], tmp_path)
 
     assert exit_code == 0
     assert "Created:" in output
@@ -122,7 +119,6 @@ def test_file_chapters_with_blanks_success(tmp_path: Path) -> None:
     output_file = tmp_path / "input.xml"
     reference_file = setup_reference_file(tmp_path, "x3-chapters-with-blanks.xml")
 
-    assert output_file.exists()
     assert_files_identical(output_file, reference_file)
 
 
@@ -131,7 +127,7 @@ def test_file_invalid_format_error(tmp_path: Path) -> None:
     input_file = EXAMPLES_DIR / "x0-chapters-invalid-format.txt"
     (tmp_path / "input.txt").write_text(input_file.read_text(encoding="utf-8"))
 
-    exit_code, output = run_cli("youtube-to-xml", ["input.txt"], tmp_path)
+    exit_code, output = run_cli(["input.txt"], tmp_path)
 
     assert exit_code == 1
     assert EXCEPTION_MESSAGES["file_invalid_format_error"] in output
@@ -140,7 +136,7 @@ def test_file_invalid_format_error(tmp_path: Path) -> None:
 @pytest.mark.slow
 def test_url_multi_chapters_success(tmp_path: Path) -> None:
     """Test YouTube fetcher with multi-chapter video."""
-    exit_code, output = run_cli("youtube-to-xml", URL_CHAPTERS, tmp_path)
+    exit_code, output = run_cli(URL_CHAPTERS, tmp_path)
 
     assert exit_code == 0
     assert "✅ Created" in output
@@ -157,7 +153,7 @@ def test_url_multi_chapters_success(tmp_path: Path) -> None:
 @pytest.mark.slow
 def test_url_multi_chapters_shared_success(tmp_path: Path) -> None:
     """Test YouTube fetcher with shared URL format containing parameters."""
-    exit_code, output = run_cli("youtube-to-xml", URL_CHAPTERS_SHARED, tmp_path)
+    exit_code, output = run_cli(URL_CHAPTERS_SHARED, tmp_path)
 
     assert exit_code == 0
     assert "✅ Created" in output
@@ -174,7 +170,7 @@ def test_url_multi_chapters_shared_success(tmp_path: Path) -> None:
 @pytest.mark.slow
 def test_url_single_chapter_success(tmp_path: Path) -> None:
     """Test YouTube fetcher with single-chapter video."""
-    exit_code, output = run_cli("youtube-to-xml", URL_NO_CHAPTERS, tmp_path)
+    exit_code, output = run_cli(URL_NO_CHAPTERS, tmp_path)
 
     assert exit_code == 0
     assert "✅ Created" in output
@@ -191,7 +187,7 @@ def test_url_single_chapter_success(tmp_path: Path) -> None:
 @pytest.mark.slow
 def test_url_playlist_processes_single_video(tmp_path: Path) -> None:
     """Test YouTube fetcher processes single video from playlist URL, not playlist."""
-    exit_code, output = run_cli("youtube-to-xml", URL_PLAYLIST, tmp_path)
+    exit_code, output = run_cli(URL_PLAYLIST, tmp_path)
 
     assert exit_code == 0
     assert "✅ Created" in output
@@ -208,10 +204,10 @@ def test_url_vs_file_equivalent_output(tmp_path: Path) -> None:
     input_file = EXAMPLES_DIR / "how-claude-code-hooks-save-me-hours-daily.txt"
     (tmp_path / "input.txt").write_text(input_file.read_text(encoding="utf-8"))
 
-    file_exit_code = run_cli("youtube-to-xml", ["input.txt"], tmp_path)[0]
+    file_exit_code = run_cli(["input.txt"], tmp_path)[0]
 
     # Process URL method
-    url_exit_code = run_cli("youtube-to-xml", URL_CHAPTERS, tmp_path)[0]
+    url_exit_code = run_cli(URL_CHAPTERS, tmp_path)[0]
 
     assert file_exit_code == 0
     assert url_exit_code == 0
@@ -277,7 +273,7 @@ def test_url_manual_transcript_priority(tmp_path: Path) -> None:
     """Test manual transcripts are prioritised over auto-generated (higher quality)."""
     test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
-    exit_code, output = run_cli("youtube-to-xml", test_url, tmp_path)
+    exit_code, output = run_cli(test_url, tmp_path)
 
     assert exit_code == 0
     assert "✅ Created" in output
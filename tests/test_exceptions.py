@@ -24,8 +24,12 @@ from youtube_to_xml.exceptions import (
 # Auto-discover all exception classes that inherit from BaseTranscriptError
 ALL_EXCEPTION_CLASSES = [
     cls
-    for _name, cls in inspect.getmembers(exceptions, inspect.isclass)
-    if (issubclass(cls, BaseTranscriptError) and cls != BaseTranscriptError)
+    for name, cls in inspect.getmembers(exceptions, inspect.isclass)
+    if (
+        issubclass(cls, BaseTranscriptError)
+        and cls != BaseTranscriptError
+        and not name.startswith("_")  # private bases carry no message of their own
+    )
 ]
 
 
@@ -87,6 +91,11 @@ class TestExceptionMessages:
             f"{orphaned_keys}"
         )
 
+    def test_exception_messages_are_read_only(self) -> None:
+        """Test that EXCEPTION_MESSAGES can't be mutated by callers."""
+        with pytest.raises(TypeError):
+            EXCEPTION_MESSAGES["file_empty_error"] = "Changed"  # type: ignore[index]
+
     def _derive_expected_message_keys(self) -> set[str]:
         """Derive expected message keys from exception class names in snake_case."""
 
@@ -6,6 +6,7 @@ Each test verifies both exit code and error message for comprehensive coverage.
 from __future__ import annotations
 
 import subprocess
+import sys
 from typing import TYPE_CHECKING
 
 import pytest
@@ -15,11 +16,13 @@ if TYPE_CHECKING:
 
 from youtube_to_xml.exceptions import EXCEPTION_MESSAGES
 
+pytestmark = pytest.mark.subprocess
+
 
 def run_cli(url: str, tmp_path: Path | None = None) -> tuple[int, str]:
     """Run youtube-to-xml CLI and return (exit_code, output)."""
     result = subprocess.run(  # noqa: S603
-        ["uv", "run", "youtube-to-xml", url],
+        [sys.executable, "-m", "youtube_to_xml", url],
         capture_output=True,
         text=True,
         cwd=tmp_path,
@@ -4,7 +4,10 @@ Tests the parse_transcript_file function which converts YouTube transcript
 files into structured TranscriptDocument objects with chapters and metadata.
 """
 
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -14,6 +17,7 @@ from youtube_to_xml.exceptions import (
 )
 from youtube_to_xml.file_parser import (
     parse_transcript_file,
+    parse_transcript_files,
 )
 from youtube_to_xml.models import (
     Chapter,
@@ -22,6 +26,9 @@ from youtube_to_xml.models import (
     VideoMetadata,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # ============= FIXTURES =============
 
 
@@ -146,6 +153,18 @@ def test_chapter_boundary_calculation(complex_transcript: str) -> None:
     assert doc.chapters[2].end_time == math.inf
 
 
+def test_chapters_emitted_in_source_order_without_sorting(
+    complex_transcript: str,
+) -> None:
+    """Chapters come out in file order, each starting where the previous ends."""
+    doc = parse_transcript_file(complex_transcript)
+
+    start_times = [chapter.start_time for chapter in doc.chapters]
+    assert start_times == sorted(start_times)
+    for chapter, next_chapter in zip(doc.chapters, doc.chapters[1:], strict=False):
+        assert chapter.end_time == next_chapter.start_time
+
+
 def test_transcript_line_ordering_preserved() -> None:
     """Transcript lines maintain original order within chapters."""
     transcript = """Chapter
@@ -204,6 +223,23 @@ Special preserved: <@> & ! and unicode 你好 🎉 résumé
     assert lines[2].text == ""
 
 
+@pytest.mark.parametrize(
+    "whitespace",
+    [
+        pytest.param("\u00a0", id="no_break_space"),
+        pytest.param("\u3000", id="ideographic_space"),
+        pytest.param("\x1f", id="unit_separator"),
+    ],
+)
+def test_unicode_whitespace_normalized_in_otherwise_clean_file(whitespace: str) -> None:
+    """Unicode whitespace is collapsed even when nothing else needs sanitizing."""
+    transcript = f"Title\n0:00\nWords{whitespace}apart"
+
+    doc = parse_transcript_file(transcript)
+
+    assert doc.chapters[0].transcript_lines[0].text == "Words apart"
+
+
 # ============= TRANSCRIPT LINE CONVERSION TESTS =============
 
 
@@ -333,6 +369,43 @@ Second text
     assert lines[2].text == ""
 
 
+# ============= BATCH PARSING TESTS =============
+
+
+def test_batch_parsing_returns_documents_in_input_order(
+    tmp_path: Path,
+    minimal_transcript: str,
+    one_chapter_transcript: str,
+    complex_transcript: str,
+) -> None:
+    """Batch parsing returns one document per file, in input order."""
+    raw_transcripts = [complex_transcript, minimal_transcript, one_chapter_transcript]
+    transcript_paths: list[Path] = []
+    for index, raw_transcript in enumerate(raw_transcripts):
+        transcript_path = tmp_path / f"transcript_{index}.txt"
+        transcript_path.write_text(raw_transcript, encoding="utf-8")
+        transcript_paths.append(transcript_path)
+
+    result = parse_transcript_files(transcript_paths, max_workers=2)
+
+    assert result == [parse_transcript_file(raw) for raw in raw_transcripts]
+    assert [len(doc.chapters) for doc in result] == [3, 1, 1]
+    assert [doc.chapters[0].start_time for doc in result] == [55.0, 2.0, 10.0]
+
+
+def test_batch_parsing_propagates_worker_errors(
+    tmp_path: Path, minimal_transcript: str
+) -> None:
+    """Errors raised in worker processes reach the caller unchanged."""
+    valid_path = tmp_path / "valid.txt"
+    valid_path.write_text(minimal_transcript, encoding="utf-8")
+    empty_path = tmp_path / "empty.txt"
+    empty_path.write_text("", encoding="utf-8")
+
+    with pytest.raises(FileEmptyError):
+        parse_transcript_files([valid_path, empty_path], max_workers=2)
+
+
 # ============= ERROR VALIDATION TESTS =============
 
 
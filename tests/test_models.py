@@ -4,6 +4,8 @@ Simple validation that models can be imported and used as expected.
 Real end-to-end testing happens when these models are used by parsers and builders.
 """
 
+import pytest
+
 from youtube_to_xml.models import (
     Chapter,
     TranscriptDocument,
@@ -19,6 +21,13 @@ def test_transcript_line_stores_timestamp_and_text() -> None:
     assert line.text == "Hello world"
 
 
+def test_transcript_line_is_immutable() -> None:
+    """TranscriptLine fields cannot be reassigned."""
+    line = TranscriptLine(timestamp=30.5, text="Hello world")
+    with pytest.raises(AttributeError):
+        line.text = "Changed"  # type: ignore[misc]
+
+
 def test_video_metadata_creates_with_empty_defaults() -> None:
     """VideoMetadata initializes with empty strings and zero duration."""
     metadata = VideoMetadata()
@@ -43,11 +52,11 @@ def test_video_metadata_stores_all_provided_values() -> None:
 
 
 def test_chapter_stores_title_times_and_transcript_lines() -> None:
-    """Chapter holds title, start/end times, and list of TranscriptLine objects."""
-    lines = [
+    """Chapter holds title, start/end times, and tuple of TranscriptLine objects."""
+    lines = (
         TranscriptLine(timestamp=0.0, text="Hello"),
         TranscriptLine(timestamp=30.5, text="World"),
-    ]
+    )
     chapter = Chapter(
         title="Introduction",
         start_time=0.0,
@@ -60,11 +69,18 @@ def test_chapter_stores_title_times_and_transcript_lines() -> None:
     assert len(chapter.transcript_lines) == 2
 
 
+def test_chapter_is_hashable_with_immutable_transcript_lines() -> None:
+    """Chapter stores transcript lines as a tuple, so frozen chapters can be hashed."""
+    chapter = Chapter("Intro", 0.0, 60.0, (TranscriptLine(0.0, "Hello"),))
+    same_chapter = Chapter("Intro", 0.0, 60.0, (TranscriptLine(0.0, "Hello"),))
+    assert hash(chapter) == hash(same_chapter)
+
+
 def test_transcript_document_combines_metadata_and_chapters() -> None:
     """TranscriptDocument holds VideoMetadata and list of Chapter objects."""
     metadata = VideoMetadata(video_title="Test Video")
     chapter = Chapter(
-        title="Chapter 1", start_time=0.0, end_time=60.0, transcript_lines=[]
+        title="Chapter 1", start_time=0.0, end_time=60.0, transcript_lines=()
     )
 
     document = TranscriptDocument(metadata=metadata, chapters=[chapter])
@@ -77,5 +93,5 @@ def test_models_use_slots() -> None:
     """Test that models use __slots__ for memory efficiency."""
     assert hasattr(VideoMetadata(), "__slots__")
     assert hasattr(TranscriptLine(0.0, ""), "__slots__")
-    assert hasattr(Chapter("", 0.0, 1.0, []), "__slots__")
+    assert hasattr(Chapter("", 0.0, 1.0, ()), "__slots__")
     assert hasattr(TranscriptDocument(VideoMetadata(), []), "__slots__")
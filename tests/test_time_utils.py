@@ -9,9 +9,9 @@ import pytest
 
 from youtube_to_xml.exceptions import FileInvalidFormatError
 from youtube_to_xml.time_utils import (
-    TIMESTAMP_PATTERN,
     format_video_duration,
     format_video_published,
+    is_timestamp,
     seconds_to_timestamp,
     timestamp_to_seconds,
 )
@@ -87,8 +87,8 @@ def test_seconds_to_timestamp_rejects_nan_values() -> None:
         seconds_to_timestamp(math.nan)
 
 
-def test_timestamp_pattern_matches_valid_formats() -> None:
-    """Test that TIMESTAMP_PATTERN regex matches valid timestamp formats."""
+def test_is_timestamp_accepts_valid_formats() -> None:
+    """Test that is_timestamp accepts valid timestamp formats."""
     valid_timestamps = [
         "0:00",
         "1:23",
@@ -99,11 +99,11 @@ def test_timestamp_pattern_matches_valid_formats() -> None:
     ]
 
     for timestamp in valid_timestamps:
-        assert TIMESTAMP_PATTERN.match(timestamp), f"Should match: {timestamp}"
+        assert is_timestamp(timestamp), f"Should match: {timestamp}"
 
 
-def test_timestamp_pattern_rejects_invalid_formats() -> None:
-    """Test that TIMESTAMP_PATTERN regex rejects invalid timestamp formats."""
+def test_is_timestamp_rejects_invalid_formats() -> None:
+    """Test that is_timestamp rejects invalid timestamp formats."""
     invalid_timestamps = [
         "1:60",
         "25:61",  # invalid minutes/seconds
@@ -118,7 +118,17 @@ def test_timestamp_pattern_rejects_invalid_formats() -> None:
     ]
 
     for timestamp in invalid_timestamps:
-        assert not TIMESTAMP_PATTERN.match(timestamp), f"Should not match: {timestamp}"
+        assert not is_timestamp(timestamp), f"Should not match: {timestamp}"
+
+
+def test_is_timestamp_rejects_three_digit_minutes() -> None:
+    """Test that is_timestamp only allows three leading digits for hours."""
+    assert is_timestamp("999:59:59")
+    assert is_timestamp("59:59")
+    assert not is_timestamp("123:45")
+    assert not is_timestamp("1234:56:59")
+    with pytest.raises(FileInvalidFormatError):
+        timestamp_to_seconds("123:45")
 
 
 def test_format_video_published_yyyymmdd_to_iso() -> None:
@@ -7,7 +7,6 @@ YouTube URLs into structured TranscriptDocument objects.
 # pyright: reportPrivateUsage=false
 
 import inspect
-from pathlib import Path
 from typing import get_args
 
 import pytest
@@ -16,6 +15,7 @@ import youtube_to_xml.url_parser as url_parser_module
 from youtube_to_xml.exceptions import (
     URLNotYouTubeError,
     URLPlaylistNotSupportedError,
+    URLTranscriptNotFoundError,
 )
 from youtube_to_xml.models import (
     Chapter,
@@ -28,9 +28,10 @@ from youtube_to_xml.url_parser import (
     _create_video_metadata,
     _extract_transcript_lines_from_json3,
     _fetch_video_metadata_and_transcript,
-    _get_youtube_transcript_file_priority,
+    _get_youtube_transcript_language_priority,
     _InternalChapterDict,
     _Json3Event,
+    _select_transcript_subtitle,
     _validate_url_is_youtube_video,
     _YtDlpMetadata,
     is_valid_url,
@@ -188,24 +189,54 @@ class TestParseYoutubeUrlFunction:
         )
 
 
-class TestTranscriptFilePriority:
-    """Test transcript file priority selection logic."""
+class TestTranscriptLanguagePriority:
+    """Test transcript language priority selection logic."""
 
-    def test_transcript_file_priority_ordering(self) -> None:
+    def test_transcript_language_priority_ordering(self) -> None:
         """Verify priority ordering: manual English > auto English > others."""
-        files = [
-            Path("video.es.json3"),  # Other language
-            Path("video.en-orig.json3"),  # Auto-generated English
-            Path("video.en.json3"),  # Manual English
-            Path("video.fr.json3"),  # Other language
+        languages = [
+            "es",  # Other language
+            "en-orig",  # Auto-generated English
+            "en",  # Manual English
+            "fr",  # Other language
         ]
 
-        sorted_files = sorted(files, key=_get_youtube_transcript_file_priority)
+        sorted_languages = sorted(
+            languages, key=_get_youtube_transcript_language_priority
+        )
 
-        assert sorted_files[0].name == "video.en.json3"  # Highest priority
-        assert sorted_files[1].name == "video.en-orig.json3"  # Medium priority
+        assert sorted_languages[0] == "en"  # Highest priority
+        assert sorted_languages[1] == "en-orig"  # Medium priority
         # Remaining two can be in any order (same priority)
 
+    def test_selects_highest_priority_json3_subtitle(self) -> None:
+        """Manual English JSON3 wins; other formats are ignored."""
+        raw_metadata: _YtDlpMetadata = {
+            "requested_subtitles": {
+                "en-orig": {"ext": "json3", "url": "https://example.com/auto"},
+                "en": {"ext": "json3", "url": "https://example.com/manual"},
+                "fr": {"ext": "vtt", "url": "https://example.com/fr"},
+            }
+        }
+
+        subtitle = _select_transcript_subtitle(raw_metadata)
+
+        assert subtitle["url"] == "https://example.com/manual"
+
+    def test_missing_json3_subtitle_raises_not_found(self) -> None:
+        """No JSON3 transcript among requested subtitles raises not-found error."""
+        raw_metadata: _YtDlpMetadata = {
+            "requested_subtitles": {
+                "en": {"ext": "vtt", "url": "https://example.com/en"},
+            }
+        }
+
+        with pytest.raises(URLTranscriptNotFoundError):
+            _select_transcript_subtitle(raw_metadata)
+
+        with pytest.raises(URLTranscriptNotFoundError):
+            _select_transcript_subtitle({"requested_subtitles": None})
+
 
 class TestExtractTranscriptLinesBehavior:
     """Test JSON3 transcript parsing behavior."""
@@ -259,7 +290,7 @@ class TestAssignChaptersBehavior:
         result = _assign_transcript_lines_to_chapters(metadata, lines, [])
         assert len(result) == 1
         assert result[0].title == "Title"
-        assert result[0].transcript_lines == lines
+        assert result[0].transcript_lines == tuple(lines)
 
     def test_assigns_lines_to_correct_chapters(self) -> None:
         """Lines are assigned to chapters based on timestamps."""
@@ -320,9 +351,9 @@ class TestDecomposedFunctions:
 class TestIsValidUrl:
     """Test basic URL structure validation (Tier 1 - instant validation)."""
 
-    def test_rejects_invalid_url_structures(self) -> None:
-        """Invalid URL structures return False."""
-        invalid_urls = [
+    @pytest.mark.parametrize(
+        "invalid_url",
+        [
             "youtube.com",  # No scheme
             "http://",  # No netloc
             "http://localhost",  # No TLD
@@ -335,14 +366,15 @@ class TestIsValidUrl:
             "/path/to/file.txt",
             "data.md",
             "config.xml",
-        ]
-
-        for invalid_url in invalid_urls:
-            assert is_valid_url(invalid_url) is False
+        ],
+    )
+    def test_rejects_invalid_url_structures(self, invalid_url: str) -> None:
+        """Invalid URL structures return False."""
+        assert is_valid_url(invalid_url) is False
 
-    def test_accepts_valid_url_structures(self) -> None:
-        """Valid URL structures return True."""
-        valid_urls = [
+    @pytest.mark.parametrize(
+        "valid_url",
+        [
             # YouTube variants (primary use case)
             "https://www.youtube.com/watch?v=abc123",
             "https://youtube.com/watch",
@@ -350,10 +382,11 @@ class TestIsValidUrl:
             # Other valid URLs (for completeness)
             "https://www.google.com",
             "http://example.com/path",
-        ]
-
-        for valid_url in valid_urls:
-            assert is_valid_url(valid_url) is True
+        ],
+    )
+    def test_accepts_valid_url_structures(self, valid_url: str) -> None:
+        """Valid URL structures return True."""
+        assert is_valid_url(valid_url) is True
 
 
 class TestValidateUrlIsYoutubeVideo:
@@ -49,10 +49,10 @@ def test_transcript_to_xml_basic_structure() -> None:
     metadata = VideoMetadata()
 
     # Single chapter test data
-    lines = [
+    lines = (
         TranscriptLine(timestamp=2.0, text="Welcome to the session"),
         TranscriptLine(timestamp=150.0, text="Let's begin"),
-    ]
+    )
     chapter = ModelsChapter(
         title="Introduction", start_time=2.0, end_time=180.0, transcript_lines=lines
     )
@@ -81,11 +81,11 @@ def test_transcript_to_xml_single_untitled_chapter() -> None:
                 title="",  # Empty title test case
                 start_time=6.0,
                 end_time=18.0,
-                transcript_lines=[
+                transcript_lines=(
                     TranscriptLine(6.0, "[Music]"),
                     TranscriptLine(15.0, "I'm so"),
                     TranscriptLine(18.0, "[Music]"),
-                ],
+                ),
             )
         ],
     )
@@ -112,11 +112,11 @@ def test_transcript_to_xml_single_untitled_chapter() -> None:
 
 def test_transcript_to_xml_inline_timestamp_format() -> None:
     """Transcript lines have inline timestamps, no bare timestamp lines."""
-    lines = [
+    lines = (
         TranscriptLine(timestamp=0.0, text="Hello world"),
         TranscriptLine(timestamp=150.0, text="Goodbye world"),
         TranscriptLine(timestamp=3661.0, text="Final line"),
-    ]
+    )
     chapter = ModelsChapter(
         title="Test", start_time=0.0, end_time=4000.0, transcript_lines=lines
     )
@@ -152,10 +152,10 @@ def test_transcript_to_xml_metadata_formatting() -> None:
 
 def test_transcript_to_xml_transcript_line_conversion() -> None:
     """TranscriptLine objects produce inline timestamp/text entries in XML."""
-    lines = [
+    lines = (
         TranscriptLine(timestamp=0.0, text="Hello world"),
         TranscriptLine(timestamp=150.0, text="Goodbye world"),
-    ]
+    )
     chapter = ModelsChapter(
         title="Test Chapter", start_time=0.0, end_time=200.0, transcript_lines=lines
     )
@@ -175,31 +175,46 @@ def test_transcript_to_xml_transcript_line_conversion() -> None:
 
 def test_transcript_to_xml_special_character_handling() -> None:
     """Special characters in metadata and transcript content are XML-escaped."""
-    lines = [TranscriptLine(0.0, 'Text with "quotes" & <tags>')]
+    lines = (TranscriptLine(0.0, 'Text with "quotes" & <tags>'),)
     chapter = ModelsChapter('Chapter & "Title" <Test>', 0.0, 60.0, lines)
     metadata = VideoMetadata(video_title='Video & "Title" <Test>')
     document = TranscriptDocument(metadata=metadata, chapters=[chapter])
 
     xml_string = transcript_to_xml(document)
 
-    assert "&amp;" in xml_string
-    assert "&quot;" in xml_string
-    assert "&lt;" in xml_string
-    assert "&gt;" in xml_string
-
+    # Parsing back only succeeds, with the original values, if escaping was correct
     root = ET.fromstring(xml_string)
     assert root.get("video_title") == 'Video & "Title" <Test>'
     chapter_elem = root.find(".//chapter")
     assert chapter_elem is not None
     assert chapter_elem.get("title") == 'Chapter & "Title" <Test>'
+    assert chapter_elem.text is not None
+    assert chapter_elem.text.strip() == '0:00 Text with "quotes" & <tags>'
+
+
+def test_transcript_to_xml_attribute_whitespace_round_trips() -> None:
+    """Tabs and line breaks in attribute values survive a parse round trip."""
+    chapter = ModelsChapter("Part\tOne\r\nIntro", 0.0, 60.0, ())
+    metadata = VideoMetadata(video_title="Line one\nLine two")
+    document = TranscriptDocument(metadata=metadata, chapters=[chapter])
+
+    xml_string = transcript_to_xml(document)
+
+    expected_chapter = '<chapter title="Part&#09;One&#13;&#10;Intro" start_time="0:00" />'
+    assert expected_chapter in xml_string
+    root = ET.fromstring(xml_string)
+    assert root.get("video_title") == "Line one\nLine two"
+    chapter_elem = root.find(".//chapter")
+    assert chapter_elem is not None
+    assert chapter_elem.get("title") == "Part\tOne\r\nIntro"
 
 
 def test_transcript_to_xml_validation(tmp_path: Path) -> None:
     """Generated XML is well-formed and parseable by ElementTree."""
-    lines = [
+    lines = (
         TranscriptLine(timestamp=0.0, text='Welcome & "Getting Started" <Overview>'),
         TranscriptLine(timestamp=148.0, text="Let's dive into the topic"),
-    ]
+    )
     chapter = ModelsChapter(
         title="Introduction", start_time=0.0, end_time=200.0, transcript_lines=lines
     )
@@ -216,7 +231,7 @@ def test_transcript_to_xml_validation(tmp_path: Path) -> None:
 
 def test_transcript_to_xml_xml_declaration() -> None:
     """XML output includes proper declaration header and newline ending."""
-    lines = [TranscriptLine(timestamp=0.0, text="Welcome to today's session")]
+    lines = (TranscriptLine(timestamp=0.0, text="Welcome to today's session"),)
     chapter = ModelsChapter(
         title="Introduction", start_time=0.0, end_time=60.0, transcript_lines=lines
     )
@@ -229,7 +244,7 @@ def test_transcript_to_xml_xml_declaration() -> None:
 
 def test_transcript_to_xml_indentation() -> None:
     """XML elements use correct indentation spacing (2 spaces per level)."""
-    lines = [TranscriptLine(0.0, "Welcome"), TranscriptLine(148.0, "Content")]
+    lines = (TranscriptLine(0.0, "Welcome"), TranscriptLine(148.0, "Content"))
     chapter = ModelsChapter("Test", 0.0, 60.0, lines)
     document = TranscriptDocument(VideoMetadata(), [chapter])
     xml_lines = transcript_to_xml(document).split("\n")
@@ -258,21 +273,21 @@ def test_transcript_to_xml_multi_chapter_complete() -> None:
                 title="Intro",
                 start_time=0.0,
                 end_time=20.0,
-                transcript_lines=[
+                transcript_lines=(
                     TranscriptLine(0.0, "Hooks are hands down one of the best"),
                     TranscriptLine(2.0, "features in Claude Code and for some"),
                     TranscriptLine(5.0, "reason a lot of people don't know about"),
-                ],
+                ),
             ),
             ModelsChapter(
                 title="Hooks",
                 start_time=20.0,
                 end_time=56.0,
-                transcript_lines=[
+                transcript_lines=(
                     TranscriptLine(20.0, "To create your first hook, use the hooks"),
                     TranscriptLine(22.0, "slash command, which shows this scary"),
                     TranscriptLine(25.0, "looking warning because hooks are"),
-                ],
+                ),
             ),
         ],
     )